@@ -1,18 +1,33 @@
 from __future__ import annotations
 
 import inspect
-from functools import wraps
+from functools import lru_cache, wraps
+from types import CodeType
 from typing import Any, Callable, ParamSpec, TypeVar, overload
+from weakref import WeakKeyDictionary
 
+from reactpy.core._life_cycle_hook import clear_hook_state, create_hook_state
 from reactpy.core.types import ComponentType, VdomDict
 
 T = TypeVar("T", bound=ComponentType | VdomDict | str | None)
 P = ParamSpec("P")
 
+# number of renders cached for each pure component
+_PURE_RENDER_CACHE_SIZE = 128
+# Renders are only cached when every argument is exactly one of these types. Equal
+# values of other types may render differently (e.g. (1,) and (True,)) and caching
+# them would hold onto arbitrary objects, such as callbacks, from any layout.
+_PURE_ARGUMENT_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# signatures are only needed by Component.__repr__ so they get created lazily
+_SIGNATURES: WeakKeyDictionary[Callable[..., Any], inspect.Signature] = (
+    WeakKeyDictionary()
+)
+
 
 @overload
 def component(
-    function: None = None, *, priority: int
+    function: None = None, *, priority: int = ..., pure: bool = ...
 ) -> Callable[[Callable[P, T]], Callable[P, Component]]: ...
 
 
@@ -24,28 +39,64 @@ def component(
     function: Callable[P, T] | None = None,
     *,
     priority: int = 0,
+    pure: bool = False,
 ) -> Callable[P, Component]:
     """A decorator for defining a new component.
 
     Parameters:
         priority: The rendering priority. Lower numbers are higher priority.
+        pure:
+            Whether the render function's output depends only on its arguments. If
+            so, recent renders are cached and reused when the component is rendered
+            again with equal arguments. Only renders whose arguments are all strings,
+            numbers, booleans, or ``None`` are cached. Pure components cannot use
+            hooks - calling one while rendering raises a ``RuntimeError``.
     """
 
     def _component(function: Callable[P, T]) -> Callable[P, Component]:
-        sig = inspect.signature(function)
-
-        if "key" in sig.parameters and sig.parameters["key"].kind in (
-            inspect.Parameter.KEYWORD_ONLY,
-            inspect.Parameter.POSITIONAL_OR_KEYWORD,
-        ):
+        unwrapped = inspect.unwrap(function)
+        if inspect.isfunction(unwrapped):
+            # inspect the code object directly - a full signature is only needed
+            # by Component.__repr__ so it gets created there
+            code = unwrapped.__code__
+            keyword_names = code.co_varnames[
+                code.co_posonlyargcount : code.co_argcount + code.co_kwonlyargcount
+            ]
+            param_names = _simple_parameter_names(code)
+        else:
+            # methods, callable objects, etc. - fall back to the signature
+            params = inspect.signature(function).parameters.values()
+            keyword_names = tuple(
+                param.name
+                for param in params
+                if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+            )
+            param_names = None
+
+        if "key" in keyword_names:
             msg = f"Component render function {function} uses reserved parameter 'key'"
             raise TypeError(msg)
 
+        if pure:
+            cached_render = lru_cache(maxsize=_PURE_RENDER_CACHE_SIZE, typed=True)(
+                function
+            )
+
+            @wraps(function)
+            def pure_constructor(
+                *args: P.args, key: Any | None = None, **kwargs: P.kwargs
+            ) -> Component:
+                return PureComponent(
+                    function, key, args, kwargs, priority, param_names, cached_render
+                )
+
+            return pure_constructor
+
         @wraps(function)
         def constructor(
             *args: P.args, key: Any | None = None, **kwargs: P.kwargs
         ) -> Component:
-            return Component(function, key, args, kwargs, sig, priority)
+            return Component(function, key, args, kwargs, priority, param_names)
 
         return constructor
 
@@ -54,6 +105,27 @@ def component(
     return _component
 
 
+def _simple_parameter_names(code: CodeType) -> tuple[str, ...] | None:
+    """The parameter names if they can all be given positionally or by keyword"""
+    if (
+        code.co_posonlyargcount
+        or code.co_kwonlyargcount
+        or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+    ):
+        return None
+    return code.co_varnames[: code.co_argcount]
+
+
+def _signature(function: Callable[..., Any]) -> inspect.Signature:
+    try:
+        return _SIGNATURES[function]
+    except KeyError:
+        sig = _SIGNATURES[function] = inspect.signature(function)
+        return sig
+    except TypeError:  # not hashable or weakly referenceable
+        return inspect.signature(function)
+
+
 class Component:
     """An object for rending component models."""
 
@@ -62,7 +134,7 @@ class Component:
         "_func",
         "_args",
         "_kwargs",
-        "_sig",
+        "_param_names",
         "key",
         "type",
         "priority",
@@ -73,23 +145,39 @@ class Component:
         function: Callable[..., ComponentType | VdomDict | str | None],
         key: Any | None,
         args: tuple[Any, ...],
-        kwargs: dict[str, Any],
-        sig: inspect.Signature,
+        kwargs: dict[str, Any] | None,
         priority: int = 0,
+        param_names: tuple[str, ...] | None = None,
     ) -> None:
         self.key = key
         self.type = function
         self._args = args
-        self._kwargs = kwargs
-        self._sig = sig
+        # most components only take positional arguments - don't hold onto empty dicts
+        self._kwargs = kwargs or None
         self.priority = priority
+        self._param_names = param_names
 
     def render(self) -> ComponentType | VdomDict | str | None:
+        if self._kwargs is None:
+            return self.type(*self._args)
         return self.type(*self._args, **self._kwargs)
 
+    def _bind_arguments(self) -> dict[str, Any]:
+        names = self._param_names
+        args, kwargs = self._args, self._kwargs or {}
+        # fast path for when every parameter was given - fall back to the
+        # signature to deal with defaults and invalid arguments
+        if names is not None and len(args) + len(kwargs) == len(names):
+            rest = names[len(args) :]
+            if all(name in kwargs for name in rest):
+                arguments = dict(zip(names, args))
+                arguments.update((name, kwargs[name]) for name in rest)
+                return arguments
+        return _signature(self.type).bind(*args, **kwargs).arguments
+
     def __repr__(self) -> str:
         try:
-            args = self._sig.bind(*self._args, **self._kwargs).arguments
+            args = self._bind_arguments()
         except TypeError:
             return f"{self.type.__name__}(...)"
         else:
@@ -98,3 +186,40 @@ class Component:
                 return f"{self.type.__name__}({id(self):02x}, {items})"
             else:
                 return f"{self.type.__name__}({id(self):02x})"
+
+
+class PureComponent(Component):
+    """A component whose renders are cached based on its arguments"""
+
+    __slots__ = ("_cached_render",)
+
+    def __init__(
+        self,
+        function: Callable[..., ComponentType | VdomDict | str | None],
+        key: Any | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any] | None,
+        priority: int,
+        param_names: tuple[str, ...] | None,
+        cached_render: Callable[..., ComponentType | VdomDict | str | None],
+    ) -> None:
+        super().__init__(function, key, args, kwargs, priority, param_names)
+        self._cached_render = cached_render
+
+    def render(self) -> ComponentType | VdomDict | str | None:
+        # The cache is shared by every layout so a cached render must not depend on
+        # any life cycle hook. Hide them so that hooks fail instead of being skipped.
+        token = create_hook_state()
+        try:
+            return self._render()
+        finally:
+            clear_hook_state(token)
+
+    def _render(self) -> ComponentType | VdomDict | str | None:
+        args, kwargs = self._args, self._kwargs
+        values = args if kwargs is None else (*args, *kwargs.values())
+        if not all(type(value) in _PURE_ARGUMENT_TYPES for value in values):
+            return super().render()
+        if kwargs is None:
+            return self._cached_render(*args)
+        return self._cached_render(*args, **kwargs)
@@ -1,9 +1,12 @@
 import asyncio
 import base64
+import binascii
 from dataclasses import asdict, is_dataclass
 import datetime
 import hashlib
+import os
 import time
+from hmac import compare_digest
 from collections.abc import Iterable
 from decimal import Decimal
 from logging import getLogger
@@ -18,6 +21,32 @@ from reactpy.backend.types import Location
 
 logger = getLogger(__name__)
 
+# bound once to avoid module attribute lookups in the serialization hot paths
+_dumps = orjson.dumps
+_loads = orjson.loads
+_b2a_base64 = binascii.b2a_base64
+_a2b_base64 = binascii.a2b_base64
+
+# type ids as they are fed to the signature hasher
+_TYPE_ID_BYTES = tuple(bytes((i,)) for i in range(256))
+# type ids as they are sent to the client
+_WIRE_TYPE_IDS = tuple(str(i).encode("ascii") for i in range(256))
+
+_MAX_CACHED_OTP_CODES = 64
+
+
+def _sign(hasher: "hashlib.blake2b", key: str, type_id: int, data: bytes) -> bytes:
+    """
+    Sign a serialized state var using a keyed hasher from _make_hash_prefix
+    """
+    # the type id is a single byte and the data is length prefixed so the
+    # fields cannot be shifted into one another without changing the signature
+    hasher.update(_TYPE_ID_BYTES[type_id])
+    hasher.update(len(data).to_bytes(4, "big"))
+    hasher.update(data)
+    hasher.update(key.encode("utf-8"))
+    return hasher.digest()
+
 
 class StateRecoveryFailureError(Exception):
     """
@@ -52,6 +81,7 @@ class StateRecoveryManager:
         self._default_serializer = default_serializer
         self._deserializer_map = deserializer_map or {}
         self._otp_mixer = otp_mixer
+        self._otp_codes: dict[int, str] = {}
 
         self._map_objects_to_ids(
             [
@@ -68,13 +98,20 @@ class StateRecoveryManager:
 
     def _map_objects_to_ids(self, serializable_types: Iterable[type]) -> dict:
         self._object_to_type_id = {}
-        self._type_id_to_object = {}
+        # type ids are dense so they can index straight into a list
+        self._type_id_to_object = []
         for idx, typ in enumerate(
             (None, bool, str, int, float, list, tuple, UUID, datetime.timezone, datetime.timedelta, *serializable_types)
         ):
-            idx_as_bytes = str(idx).encode("utf-8")
-            self._object_to_type_id[typ] = idx_as_bytes
-            self._type_id_to_object[idx_as_bytes] = typ
+            # type ids are signed as a single byte
+            if idx >= len(_TYPE_ID_BYTES):
+                raise ValueError(
+                    f"Too many serializable types (at most {len(_TYPE_ID_BYTES)} allowed)"
+                )
+            self._object_to_type_id[typ] = idx
+            self._type_id_to_object.append(typ)
+        # resolved type ids of subclasses are added as they are encountered
+        self._type_id_cache = dict(self._object_to_type_id)
 
     def _discover_otp_key(self) -> str:
         """
@@ -82,24 +119,51 @@ class StateRecoveryManager:
         ReactPy is installed and taking down the names and creation times
         of everything in there.
         """
-        hasher = hashlib.sha256()
         parent_dir_of_root = Path(__file__).parent.parent.parent
-        for thing in parent_dir_of_root.iterdir():
-            hasher.update((thing.name + str(thing.stat().st_ctime)).encode("utf-8"))
-        return hasher.hexdigest()
+        buffer = bytearray()
+        # sort so the key does not depend on the order the filesystem lists entries
+        with os.scandir(parent_dir_of_root) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                buffer += entry.name.encode("utf-8")
+                buffer += str(entry.stat().st_ctime).encode("utf-8")
+        return hashlib.blake2b(buffer, digest_size=32).hexdigest()
+
+    def _get_otp_code(self, target_time: float) -> str:
+        """
+        Get the OTP code for the interval window that target_time falls in.
+
+        Codes only change once per window so they are cached rather than
+        recomputed for every serializer.
+        """
+        window = int(target_time // self._totp.interval)
+        try:
+            return self._otp_codes[window]
+        except KeyError:
+            pass
+        if len(self._otp_codes) >= _MAX_CACHED_OTP_CODES:
+            self._otp_codes.clear()
+        at = self._totp.at
+        window_time = window * self._totp.interval
+        code = self._otp_codes[window] = (
+            f"{at(window_time)}"
+            f"{at(window_time - self._otp_mixer)}"
+            f"{at(window_time + self._otp_mixer)}"
+        )
+        return code
 
     def create_serializer(
         self, salt: str, target_time: float | None = None
     ) -> "StateRecoverySerializer":
         return StateRecoverySerializer(
-            totp=self._totp,
+            get_otp_code=self._get_otp_code,
+            otp_interval=self._totp.interval,
             target_time=target_time,
             otp_max_age=self._otp_max_age,
-            otp_mixer=self._otp_mixer,
             pepper=self._pepper,
             salt=salt,
             object_to_type_id=self._object_to_type_id,
             type_id_to_object=self._type_id_to_object,
+            type_id_cache=self._type_id_cache,
             max_object_length=self._max_object_length,
             max_num_state_objects=self._max_num_state_objects,
             default_serializer=self._default_serializer,
@@ -111,30 +175,35 @@ class StateRecoverySerializer:
 
     def __init__(
         self,
-        totp: pyotp.TOTP,
+        get_otp_code: Callable[[float], str],
+        otp_interval: int,
         target_time: float | None,
         otp_max_age: int,
-        otp_mixer: float,
         pepper: str,
         salt: str,
-        object_to_type_id: dict[Any, bytes],
-        type_id_to_object: dict[bytes, Any],
+        object_to_type_id: dict[Any, int],
+        type_id_to_object: list[Any],
+        type_id_cache: dict[Any, int],
         max_object_length: int,
         max_num_state_objects: int,
         default_serializer: Callable[[Any], bytes] | None = None,
         deserializer_map: dict[type, Callable[[Any], Any]] | None = None,
     ) -> None:
-        self._totp = totp
-        self._otp_mixer = otp_mixer
+        self._get_otp_code = get_otp_code
+        self._otp_interval = otp_interval
         target_time = target_time or time.time()
         self._target_time = target_time
-        otp_code = self._get_otp_code(target_time)
+        otp_code = get_otp_code(target_time)
         self._otp_max_age = otp_max_age
         self._otp_code = otp_code.encode("utf-8")
         self._pepper = pepper.encode("utf-8")
         self._salt = salt.encode("utf-8")
         self._object_to_type_id = object_to_type_id
         self._type_id_to_object = type_id_to_object
+        self._type_id_cache = type_id_cache
+        self._str_type_id = object_to_type_id[str]
+        self._int_type_id = object_to_type_id[int]
+        self._float_type_id = object_to_type_id[float]
         self._max_object_length = max_object_length
         self._max_num_state_objects = max_num_state_objects
         self._provided_default_serializer = default_serializer
@@ -142,32 +211,56 @@ class StateRecoverySerializer:
             datetime.timezone: lambda x: datetime.timezone(
                 datetime.timedelta(**x["offset"]), x["name"]
             ),
+            datetime.datetime: datetime.datetime.fromisoformat,
+            datetime.date: datetime.date.fromisoformat,
+            datetime.time: datetime.time.fromisoformat,
         }
         self._deserializer_map = deserialization_map | (deserializer_map or {})
+        self._hash_prefix = self._make_hash_prefix(self._otp_code)
 
-    def _get_otp_code(self, target_time: float) -> str:
-        at = self._totp.at
-        return f"{at(target_time)}{at(target_time - self._otp_mixer)}{at(target_time + self._otp_mixer)}"
-
-    async def serialize_state_vars(
-        self, state_vars: dict[str, Any]
-    ) -> dict[str, tuple[str, str, str]]:
+    async def serialize_state_vars(self, state_vars: dict[str, Any]) -> dict[str, str]:
         if len(state_vars) > self._max_num_state_objects:
             logger.warning(
                 f"State is too large ({len(state_vars)}). State will not be sent"
             )
             return {}
-        result = {}
+        result: dict[str, str] = {}
         for chunk in chunked(state_vars.items(), 50):
-            for key, value in chunk:
-                result[key] = self._serialize(key, value)
+            self._serialize_chunk(chunk, result)
             await asyncio.sleep(0)  # relinquish CPU
         return result
 
-    def _serialize(self, key: str, obj: object) -> tuple[str, str, str]:
-        type_id = b"1"  # bool
-        if obj is None:
-            return "0", "", ""
+    def _serialize_chunk(
+        self,
+        items: Iterable[tuple[str, Any]],
+        result: dict[str, str],
+    ) -> None:
+        """
+        Serialize, sign, and encode state vars for the client in a single pass.
+
+        Each value is sent as ``<type id>.<base64 data>.<base64 signature>``.
+        """
+        serialize_value = self._serialize_value
+        new_hasher = self._hash_prefix.copy
+        wire_type_ids = _WIRE_TYPE_IDS
+        b2a_base64 = _b2a_base64
+        join = b".".join
+        for key, value in items:
+            if value is None:
+                result[key] = "0.."
+                continue
+            type_id, data = serialize_value(value)
+            signature = _sign(new_hasher(), key, type_id, data)
+            result[key] = join(
+                (
+                    wire_type_ids[type_id],
+                    b2a_base64(data, newline=False),
+                    b2a_base64(signature, newline=False),
+                )
+            ).decode("ascii")
+
+    def _serialize_value(self, obj: Any) -> tuple[int, bytes]:
+        type_id = 1  # bool
         match obj:
             case True:
                 result = b"true"
@@ -175,97 +268,132 @@ class StateRecoverySerializer:
                 result = b"false"
             case _:
                 obj_type = type(obj)
-                if obj_type in (list, tuple):
-                    if len(obj) != 0:
-                        obj_type = type(obj[0])
-                for t in obj_type.__mro__:
-                    type_id = self._object_to_type_id.get(t)
-                    if type_id:
-                        break
+                # fast path for the most common built-in types
+                if obj_type is str:
+                    type_id = self._str_type_id
+                elif obj_type is int:
+                    type_id = self._int_type_id
+                elif obj_type is float:
+                    type_id = self._float_type_id
                 else:
-                    raise ValueError(
-                        f"Objects of type {obj_type} was not part of serializable_types"
-                    )
+                    if obj_type in (list, tuple):
+                        if len(obj) != 0:
+                            obj_type = type(obj[0])
+                    cached_type_id = self._type_id_cache.get(obj_type)
+                    if cached_type_id is None:  # not "or" - 0 is a valid type id
+                        type_id = self._resolve_type_id(obj_type)
+                    else:
+                        type_id = cached_type_id
                 result = self._serialize_object(obj)
                 if len(result) > self._max_object_length:
                     raise ValueError(
                         f"Serialized object {obj} is too long (length: {len(result)})"
                     )
-        signature = self._sign_serialization(key, type_id, result)
-        return (
-            type_id.decode("utf-8"),
-            base64.urlsafe_b64encode(result).decode("utf-8"),
-            signature,
+        return type_id, result
+
+    def _resolve_type_id(self, obj_type: type) -> int:
+        for t in obj_type.__mro__:
+            type_id = self._object_to_type_id.get(t)
+            if type_id is not None:
+                self._type_id_cache[obj_type] = type_id
+                return type_id
+        raise ValueError(
+            f"Objects of type {obj_type} was not part of serializable_types"
         )
 
-    def deserialize_client_state(
-        self, state_vars: dict[str, tuple[str, str, str]]
-    ) -> None:
-        return {
-            key: self._deserialize(key, type_id.encode("utf-8"), data, signature)
-            for key, (type_id, data, signature) in state_vars.items()
-        }
+    def deserialize_client_state(self, state_vars: dict[str, str]) -> dict[str, Any]:
+        return {key: self._deserialize(key, value) for key, value in state_vars.items()}
 
-    def _deserialize(
-        self, key: str, type_id: bytes, data: bytes, signature: str
-    ) -> Any:
-        if type_id == b"0":
+    def _deserialize(self, key: str, value: str) -> Any:
+        if not isinstance(value, str):
+            raise StateRecoveryFailureError(f"Malformed state var {key}")
+        try:
+            type_id_str, data, signature = value.split(".")
+        except ValueError as err:
+            raise StateRecoveryFailureError(f"Malformed state var {key}") from err
+        try:
+            type_id = int(type_id_str)
+        except ValueError as err:
+            raise StateRecoveryFailureError(f"Unknown type id {type_id_str}") from err
+        if type_id == 0:
             return None
+        if not 0 < type_id < len(self._type_id_to_object):
+            raise StateRecoveryFailureError(f"Unknown type id {type_id_str}")
+        typ = self._type_id_to_object[type_id]
+
         try:
-            typ = self._type_id_to_object[type_id]
-        except KeyError as err:
-            raise StateRecoveryFailureError(f"Unknown type id {type_id}") from err
-
-        result = base64.urlsafe_b64decode(data)
-        expected_signature = self._sign_serialization(key, type_id, result)
-        if expected_signature != signature:
-            if not self._try_future_code(key, type_id, result, signature):
+            result = _a2b_base64(data)
+            signature_bytes = _a2b_base64(signature)
+        except ValueError as err:  # includes binascii.Error
+            raise StateRecoveryFailureError(f"Malformed state var {key}") from err
+        self._verify_signature(key, type_id, result, signature_bytes)
+        return self._deserialize_object(typ, result)
+
+    def _verify_signature(
+        self, key: str, type_id: int, data: bytes, signature: bytes
+    ) -> None:
+        expected_signature = self._sign_serialization(key, type_id, data)
+        if not compare_digest(expected_signature, signature):
+            if not self._try_future_code(key, type_id, data, signature):
                 if not self._try_older_codes_and_see_if_one_checks_out(
-                    key, type_id, result, signature
+                    key, type_id, data, signature
                 ):
                     raise StateRecoveryFailureError(
                         f"Signature mismatch for type id {type_id}"
                     )
-        return self._deserialize_object(typ, result)
 
     def _try_future_code(
-        self, key: str, type_id: bytes, data: bytes, signature: str
+        self, key: str, type_id: int, data: bytes, signature: bytes
     ) -> bool:
-        future_time = self._target_time + self._totp.interval
+        future_time = self._target_time + self._otp_interval
         otp_code = self._get_otp_code(future_time).encode("utf-8")
-        return self._sign_serialization(key, type_id, data, otp_code) == signature
+        return compare_digest(
+            self._sign_serialization(key, type_id, data, otp_code), signature
+        )
 
     def _try_older_codes_and_see_if_one_checks_out(
-        self, key: str, type_id: bytes, data: bytes, signature: str
+        self, key: str, type_id: int, data: bytes, signature: bytes
     ) -> bool:
         past_time = self._target_time
         for _ in range(100):
-            past_time -= self._totp.interval
+            past_time -= self._otp_interval
             otp_code = self._get_otp_code(past_time).encode("utf-8")
-            if self._sign_serialization(key, type_id, data, otp_code) == signature:
+            if compare_digest(
+                self._sign_serialization(key, type_id, data, otp_code), signature
+            ):
                 return True
             if past_time < self._target_time - self._otp_max_age:
                 return False
         raise RuntimeError("Too many iterations: _try_older_codes_and_see_if_one_checks_out")
 
+    def _make_hash_prefix(self, otp_code: bytes) -> "hashlib.blake2b":
+        """
+        Create a keyed hasher from the parts of the signature that do not change
+        for the lifetime of the serializer
+        """
+        mac_key = self._pepper + otp_code + self._salt
+        if len(mac_key) > hashlib.blake2b.MAX_KEY_SIZE:
+            # compress rather than truncate so every part still contributes
+            mac_key = hashlib.blake2b(mac_key).digest()
+        return hashlib.blake2b(key=mac_key, digest_size=16)
+
     def _sign_serialization(
-        self, key: str, type_id: bytes, data: bytes, otp_code: bytes | None = None
-    ) -> str:
-        hasher = hashlib.sha256()
-        hasher.update(type_id)
-        hasher.update(data)
-        hasher.update(self._pepper)
-        hasher.update(otp_code or self._otp_code)
-        hasher.update(self._salt)
-        hasher.update(key.encode("utf-8"))
-        return hasher.hexdigest()
+        self, key: str, type_id: int, data: bytes, otp_code: bytes | None = None
+    ) -> bytes:
+        if otp_code is None:
+            hasher = self._hash_prefix.copy()
+        else:
+            hasher = self._make_hash_prefix(otp_code)
+        return _sign(hasher, key, type_id, data)
 
     def _serialize_object(self, obj: Any) -> bytes:
-        return orjson.dumps(obj, default=self._default_serializer)
+        return _dumps(obj, default=self._default_serializer)
 
     def _default_serializer(self, obj: Any) -> bytes:
         if isinstance(obj, datetime.timezone):
             return {"name": obj.tzname(None), "offset": obj.utcoffset(None)}
+        if isinstance(obj, Decimal):
+            return str(obj)
         if isinstance(obj, datetime.timedelta):
             return {"days": obj.days, "seconds": obj.seconds, "microseconds": obj.microseconds}
         if is_dataclass(obj):
@@ -288,7 +416,7 @@ class StateRecoverySerializer:
     def _deserialize_object(self, typ: Any, data: bytes) -> Any:
         if typ is None and not data:
             return None
-        result = orjson.loads(data)
+        result = _loads(data)
         custom_deserializer = self._deserializer_map.get(typ)
         if type(result) in (list, tuple):
             return [
@@ -1,5 +1,11 @@
+from functools import wraps
+from unittest.mock import patch
+
+import pytest
+
 import reactpy
-from reactpy.testing import DisplayFixture
+from reactpy.config import REACTPY_ASYNC_RENDERING
+from reactpy.testing import DisplayFixture, assert_reactpy_did_log
 
 
 def test_component_repr():
@@ -16,6 +22,31 @@ def test_component_repr():
     assert repr(MyComponent()) == "MyComponent(...)"
 
 
+def test_component_repr_with_simple_parameters():
+    @reactpy.component
+    def MyComponent(a, b=1):
+        pass
+
+    mc1 = MyComponent(1, b=2)
+    assert repr(mc1) == f"MyComponent({id(mc1):02x}, a=1, b=2)"
+
+    # defaults are not included
+    mc2 = MyComponent(1)
+    assert repr(mc2) == f"MyComponent({id(mc2):02x}, a=1)"
+
+    # multiple values for argument 'a'
+    assert repr(MyComponent(1, a=2)) == "MyComponent(...)"
+
+
+def test_bound_method_component_repr():
+    class MyView:
+        def view(self, a):
+            pass
+
+    mc = reactpy.component(MyView().view)(1)
+    assert repr(mc) == f"view({id(mc):02x}, a=1)"
+
+
 async def test_simple_component():
     @reactpy.component
     def SimpleDiv():
@@ -44,6 +75,114 @@ async def test_component_with_var_args():
     }
 
 
+async def test_invalid_arguments_raise_when_rendered():
+    @reactpy.component
+    def Child(a):
+        return reactpy.html.div(a)
+
+    child = Child(1, b=2)  # errors belong to the child, not whoever created it
+    with pytest.raises(TypeError, match="unexpected keyword argument 'b'"):
+        child.render()
+
+
+async def test_callable_object_component():
+    class Greeting:
+        def __call__(self, name):
+            return reactpy.html.div(f"hello {name}")
+
+    assert reactpy.component(Greeting())("world").render() == {
+        "tagName": "div",
+        "children": ["hello world"],
+    }
+
+
+def test_wrapped_render_function_cannot_use_key_parameter():
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    with pytest.raises(TypeError, match="reserved parameter 'key'"):
+
+        @reactpy.component
+        @decorator
+        def MyComponent(key):
+            pass
+
+
+async def test_pure_component_reuses_render_for_equal_args():
+    render_count = 0
+
+    @reactpy.component(pure=True)
+    def PureDiv(text, attrs=None):
+        nonlocal render_count
+        render_count += 1
+        return reactpy.html.div(attrs or {}, text)
+
+    first = PureDiv("hello").render()
+    assert PureDiv("hello").render() is first
+    assert render_count == 1
+
+    assert PureDiv("world").render() == {"tagName": "div", "children": ["world"]}
+    assert render_count == 2
+
+    # renders with other argument types are not cached
+    PureDiv("hello", attrs={"id": "a"}).render()
+    PureDiv("hello", attrs={"id": "a"}).render()
+    assert render_count == 4
+
+
+async def test_pure_component_only_caches_scalar_arguments():
+    @reactpy.component(pure=True)
+    def PureRepr(value):
+        return reactpy.html.div(repr(value))
+
+    # these compare equal and hash the same but do not render the same
+    assert PureRepr((1,)).render() == {"tagName": "div", "children": ["(1,)"]}
+    assert PureRepr((True,)).render() == {"tagName": "div", "children": ["(True,)"]}
+    assert PureRepr(1).render() == {"tagName": "div", "children": ["1"]}
+    assert PureRepr(True).render() == {"tagName": "div", "children": ["True"]}
+
+
+async def test_pure_component_render_is_shared_between_layouts():
+    render_count = 0
+
+    @reactpy.component(pure=True)
+    def PureDiv(text):
+        nonlocal render_count
+        render_count += 1
+        return reactpy.html.div(text)
+
+    with patch.object(REACTPY_ASYNC_RENDERING, "current", False):
+        for _ in range(2):
+            async with reactpy.Layout(PureDiv("hello")) as layout:
+                layout.start_rendering()
+                update = await layout.render()
+                assert update["model"] == {
+                    "tagName": "",
+                    "children": [{"tagName": "div", "children": ["hello"]}],
+                }
+
+    assert render_count == 1
+
+
+async def test_pure_component_cannot_use_hooks():
+    @reactpy.component(pure=True)
+    def PureCounter(label):
+        count, set_count = reactpy.use_state(0)
+        return reactpy.html.button({"on_click": lambda event: set_count(1)}, label)
+
+    with patch.object(REACTPY_ASYNC_RENDERING, "current", False):
+        for _ in range(2):
+            with assert_reactpy_did_log(match_error="No life cycle hook is active"):
+                async with reactpy.Layout(PureCounter("click")) as layout:
+                    layout.start_rendering()
+                    update = await layout.render()
+            assert "error" in update["model"]
+
+
 async def test_display_simple_hello_world(display: DisplayFixture):
     @reactpy.component
     def Hello():
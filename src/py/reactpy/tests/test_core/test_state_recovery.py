@@ -0,0 +1,108 @@
+import datetime
+from dataclasses import dataclass
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from reactpy.backend.types import Location
+from reactpy.core.state_recovery import (
+    StateRecoveryFailureError,
+    StateRecoveryManager,
+)
+
+OTP_INTERVAL = 10
+OTP_MAX_AGE = 100
+NOW = 1_700_000_000
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@pytest.fixture
+def manager():
+    return StateRecoveryManager(
+        [Point],
+        pepper="pepper",
+        otp_key="otp-key",
+        otp_interval=OTP_INTERVAL,
+        otp_max_age=OTP_MAX_AGE,
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        False,
+        "hello",
+        1,
+        1.5,
+        [1, 2, 3],
+        [Point(1, 2), Point(3, 4)],
+        UUID("12345678-1234-5678-1234-567812345678"),
+        datetime.timezone(datetime.timedelta(hours=1), "CET"),
+        datetime.timedelta(days=1, seconds=2, microseconds=3),
+        Decimal("1.25"),
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        datetime.date(2024, 1, 2),
+        datetime.time(3, 4, 5),
+        Location("/path", "?query=1"),
+        Point(1, 2),
+    ],
+)
+async def test_state_var_round_trip(manager, value):
+    serializer = manager.create_serializer("salt", NOW)
+    state_vars = await serializer.serialize_state_vars({"key": value})
+    assert serializer.deserialize_client_state(state_vars) == {"key": value}
+
+
+async def test_state_var_cannot_be_moved_to_another_key(manager):
+    serializer = manager.create_serializer("salt", NOW)
+    state_vars = await serializer.serialize_state_vars({"a": 1, "b": 2})
+    swapped = {"a": state_vars["b"], "b": state_vars["a"]}
+    with pytest.raises(StateRecoveryFailureError):
+        serializer.deserialize_client_state(swapped)
+
+
+async def test_state_var_signed_with_another_salt_is_rejected(manager):
+    state_vars = await manager.create_serializer("salt", NOW).serialize_state_vars(
+        {"a": 1}
+    )
+    with pytest.raises(StateRecoveryFailureError):
+        manager.create_serializer("other-salt", NOW).deserialize_client_state(
+            state_vars
+        )
+
+
+@pytest.mark.parametrize("offset", [-OTP_INTERVAL, OTP_INTERVAL, -OTP_MAX_AGE])
+async def test_state_var_from_nearby_otp_window_is_accepted(manager, offset):
+    state_vars = await manager.create_serializer(
+        "salt", NOW + offset
+    ).serialize_state_vars({"a": 1})
+    deserializer = manager.create_serializer("salt", NOW)
+    assert deserializer.deserialize_client_state(state_vars) == {"a": 1}
+
+
+@pytest.mark.parametrize("offset", [2 * OTP_INTERVAL, -2 * OTP_MAX_AGE])
+async def test_state_var_from_distant_otp_window_is_rejected(manager, offset):
+    state_vars = await manager.create_serializer(
+        "salt", NOW + offset
+    ).serialize_state_vars({"a": 1})
+    deserializer = manager.create_serializer("salt", NOW)
+    with pytest.raises(StateRecoveryFailureError):
+        deserializer.deserialize_client_state(state_vars)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["abc", "-1..", "999..", "1.x.y", "1.MQ==.", "1..", ["1", "MQ==", "x"], None],
+)
+def test_malformed_state_var_is_rejected(manager, value):
+    serializer = manager.create_serializer("salt", NOW)
+    with pytest.raises(StateRecoveryFailureError):
+        serializer.deserialize_client_state({"a": value})